@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for the Travel Planner AI Chatbot
+
+Run with: SERVER=gunicorn gunicorn -c gunicorn_conf.py travel_chatbot:app
+"""
+
+import os
+
+bind = '0.0.0.0:5000'
+workers = 2 * os.cpu_count() + 1
+worker_class = 'gevent'
+worker_connections = 1000
+preload_app = True
+
+# Workers need SERVER=gunicorn so the app applies the gevent monkey-patch
+# before importing anything else
+raw_env = ['SERVER=gunicorn']
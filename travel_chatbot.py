@@ -3,126 +3,247 @@ Travel Planner AI Chatbot
 Advanced travel planning assistant with security, OpenAI function calling, and travel-only restrictions
 """
 
+import os
+
+# Under Gunicorn's gevent workers (see gunicorn_conf.py) sockets must be
+# patched before anything else imports the stdlib networking modules
+if os.environ.get('SERVER') == 'gunicorn':
+    from gevent import monkey
+    monkey.patch_all()
+
+import functools
+import hashlib
+import itertools
 import json
+import orjson
 import pandas as pd
+import queue
+import random
+import threading
+import time
 import re
+import unicodedata
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import ahocorasick
 import openai
-from datetime import datetime
-from flask import Flask, request, jsonify, render_template
+import rapidfuzz
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import LRUCache, TTLCache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
+
+class ORJSONProvider(JSONProvider):
+    """Back jsonify and request.get_json with orjson instead of stdlib json"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
-# Configure logging
+# Configure logging: request threads only enqueue records; the listener
+# thread does the blocking file/stream writes off the hot path
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('travel_chatbot.log', encoding='utf-8')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+# Leave the record message untouched on enqueue; the listener's handlers
+# apply the real format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    encoding='utf-8',
-    handlers=[
-        logging.FileHandler('travel_chatbot.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[_queue_handler]
 )
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+
 logger = logging.getLogger(__name__)
 security_logger = logging.getLogger('security')
 travel_logger = logging.getLogger('travel')
 
 # OpenAI Configuration
-openai.api_key = open('OpenAI_API_Key.txt', 'r').read().strip()
+@functools.lru_cache(maxsize=1)
+def _load_api_key():
+    """Read the OpenAI API key once, closing the file handle properly"""
+    with open('OpenAI_API_Key.txt', 'r', encoding='utf-8') as key_file:
+        return key_file.read().strip()
+
+
+openai.api_key = _load_api_key()
+
+# Share one pooled HTTP session across all OpenAI calls so concurrent chat
+# requests reuse kept-alive connections instead of opening a new one per call
+_openai_session = requests.Session()
+_openai_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=100))
+openai.requestssession = _openai_session
 
 
 class TravelSecurityValidator:
     """Advanced security and travel topic validation system"""
 
-    def __init__(self):
-        # Travel-related keywords for validation
-        self.travel_keywords = {
-            'destinations': [
-                'city', 'country', 'destination', 'place', 'location', 'visit', 'travel to',
-                'paris', 'london', 'tokyo', 'new york', 'dubai', 'barcelona', 'rome',
-                'bangkok', 'sydney', 'mumbai', 'europe', 'asia', 'america', 'africa'
-            ],
-            'accommodation': [
-                'hotel', 'hostel', 'resort', 'accommodation', 'stay', 'lodge', 'inn',
-                'apartment', 'booking', 'room', 'suite', 'bed and breakfast'
-            ],
-            'activities': [
-                'attraction', 'sightseeing', 'tour', 'museum', 'landmark', 'monument',
-                'beach', 'park', 'temple', 'church', 'castle', 'gallery', 'zoo',
-                'shopping', 'restaurant', 'nightlife', 'entertainment'
-            ],
-            'transportation': [
-                'flight', 'plane', 'airport', 'train', 'bus', 'taxi', 'car rental',
-                'transportation', 'metro', 'subway', 'ferry', 'cruise'
-            ],
-            'planning': [
-                'itinerary', 'schedule', 'plan', 'trip', 'vacation', 'holiday', 'journey',
-                'budget', 'cost', 'price', 'expense', 'currency', 'exchange',
-                'visa', 'passport', 'weather', 'climate', 'season'
-            ]
-        }
+    SUGGESTIONS = (
+        "Try asking about hotels, attractions, or itineraries for your destination!",
+        "I can help you plan trips - ask about destinations, budgets, or travel recommendations!",
+        "Let's focus on travel planning - ask me about accommodations, activities, or trip costs!",
+        "Ask me about travel topics like finding hotels, creating itineraries, or budgeting for trips!"
+    )
+
+    # Travel-related keywords for validation
+    travel_keywords = {
+        'destinations': [
+            'city', 'country', 'destination', 'place', 'location', 'visit', 'travel to',
+            'paris', 'london', 'tokyo', 'new york', 'dubai', 'barcelona', 'rome',
+            'bangkok', 'sydney', 'mumbai', 'europe', 'asia', 'america', 'africa'
+        ],
+        'accommodation': [
+            'hotel', 'hostel', 'resort', 'accommodation', 'stay', 'lodge', 'inn',
+            'apartment', 'booking', 'room', 'suite', 'bed and breakfast'
+        ],
+        'activities': [
+            'attraction', 'sightseeing', 'tour', 'museum', 'landmark', 'monument',
+            'beach', 'park', 'temple', 'church', 'castle', 'gallery', 'zoo',
+            'shopping', 'restaurant', 'nightlife', 'entertainment'
+        ],
+        'transportation': [
+            'flight', 'plane', 'airport', 'train', 'bus', 'taxi', 'car rental',
+            'transportation', 'metro', 'subway', 'ferry', 'cruise'
+        ],
+        'planning': [
+            'itinerary', 'schedule', 'plan', 'trip', 'vacation', 'holiday', 'journey',
+            'budget', 'cost', 'price', 'expense', 'currency', 'exchange',
+            'visa', 'passport', 'weather', 'climate', 'season'
+        ]
+    }
 
-        # Security threat detection
-        self.threat_words = {
-            'high_threat': [
-                'bomb', 'terrorist', 'kill', 'murder', 'attack', 'violence', 'weapon',
-                'gun', 'knife', 'explosive', 'threat', 'harm', 'destroy'
-            ],
-            'inappropriate': [
-                'sex', 'porn', 'nude', 'adult', 'drug', 'cocaine', 'marijuana'
-            ],
-            'travel_illegal': [
-                'visa fraud', 'fake passport', 'smuggling', 'human trafficking',
-                'drug trafficking', 'money laundering', 'illegal border'
-            ]
-        }
+    # Security threat detection, ordered by expected hit frequency
+    threat_words = {
+        'inappropriate': [
+            'sex', 'porn', 'nude', 'adult', 'drug', 'cocaine', 'marijuana'
+        ],
+        'high_threat': [
+            'bomb', 'terrorist', 'kill', 'murder', 'attack', 'violence', 'weapon',
+            'gun', 'knife', 'explosive', 'threat', 'harm', 'destroy'
+        ],
+        'travel_illegal': [
+            'visa fraud', 'fake passport', 'smuggling', 'human trafficking',
+            'drug trafficking', 'money laundering', 'illegal border'
+        ]
+    }
 
-        # Non-travel topics to block
-        self.non_travel_topics = {
-            'technology': [
-                'programming', 'coding', 'software', 'computer', 'python', 'javascript',
-                'html', 'css', 'database', 'api', 'algorithm'
-            ],
-            'entertainment': [
-                'movie', 'tv show', 'music', 'song', 'game', 'sport', 'celebrity', 'news'
-            ],
-            'education': [
-                'homework', 'essay', 'study', 'exam', 'math problem', 'research paper'
-            ],
-            'general': [
-                'hello', 'hi', 'how are you', 'tell me a joke', 'what do you think'
-            ]
-        }
+    # Non-travel topics to block
+    non_travel_topics = {
+        'technology': [
+            'programming', 'coding', 'software', 'computer', 'python', 'javascript',
+            'html', 'css', 'database', 'api', 'algorithm'
+        ],
+        'entertainment': [
+            'movie', 'tv show', 'music', 'song', 'game', 'sport', 'celebrity', 'news'
+        ],
+        'education': [
+            'homework', 'essay', 'study', 'exam', 'math problem', 'research paper'
+        ],
+        'general': [
+            'hello', 'hi', 'how are you', 'tell me a joke', 'what do you think'
+        ]
+    }
 
-        # Compile patterns for efficient matching
-        self._compile_patterns()
+    @classmethod
+    def _compile_patterns(cls):
+        """Build shared keyword matching structures once at import time
 
-    def _compile_patterns(self):
-        """Compile regex patterns for efficient matching"""
-        # Travel keywords pattern
-        all_travel_words = []
-        for category, words in self.travel_keywords.items():
-            all_travel_words.extend(words)
+        The compiled structures live on the class, so preloaded
+        multi-process servers share them copy-on-write after fork instead
+        of recompiling per worker.
+        """
+        # Travel keyword lookup: set membership for single words,
+        # substring checks for the few multi-word phrases
+        all_travel_words = [word.lower() for words in cls.travel_keywords.values() for word in words]
+        cls.travel_word_set = frozenset(word for word in all_travel_words if ' ' not in word)
+        cls.travel_multiword = tuple(word for word in all_travel_words if ' ' in word)
+        cls.token_pattern = re.compile(r'[a-z]+')
+
+        # Travel-specific phrase boosts as one pre-joined alternation.
+        # Input is lowercased once in validate_content and every keyword
+        # structure stores lowercase, so no case folding during matching
+        cls.phrase_boost_pattern = re.compile(
+            r'\b(?:trip to|travel to|visit|vacation in|holiday in)\b'
+            r'|\b(?:hotel in|stay in|accommodation in)\b'
+            r'|\b(?:attractions in|things to do in)\b'
+            r'|\b(?:budget for|cost of).+(?:trip|travel|vacation)\b'
+            r'|\b(?:weather in|climate in|best time to visit)\b'
+        )
 
-        self.travel_pattern = re.compile(
-            r'\b(?:' + '|'.join(re.escape(word) for word in all_travel_words) + r')\b',
-            re.IGNORECASE
+        # Probe set for the zero-score fast path: every single-word keyword
+        # plus the leading word of each phrase that can contribute to the
+        # score. A message with no token in this set can never score > 0
+        cls._hot_travel_tokens = (
+            cls.travel_word_set
+            | {phrase.split()[0] for phrase in cls.travel_multiword}
+            | {'trip', 'travel', 'visit', 'vacation', 'holiday', 'hotel', 'stay', 'accommodation',
+               'attractions', 'things', 'budget', 'cost', 'weather', 'climate', 'best'}
         )
 
-        # Threat patterns
-        self.threat_patterns = {}
-        for category, words in self.threat_words.items():
-            pattern = r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b'
-            self.threat_patterns[category] = re.compile(pattern, re.IGNORECASE)
+        # One merged automaton scans every threat category in a single pass
+        cls.threat_automaton = cls._build_automaton(cls.threat_words)
 
-        # Non-travel patterns
-        self.non_travel_patterns = {}
-        for category, words in self.non_travel_topics.items():
-            pattern = r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b'
-            self.non_travel_patterns[category] = re.compile(pattern, re.IGNORECASE)
+        # Same treatment for non-travel topics: one automaton over every
+        # category, scanned once, instead of one scan per category
+        cls.non_travel_automaton = cls._build_automaton(cls.non_travel_topics)
+
+    @staticmethod
+    def _build_automaton(words_by_category):
+        """Build an Aho-Corasick automaton over the given keyword categories
+
+        Payloads carry (word, category) so a merged automaton can report
+        which category matched without separate per-category scans.
+        """
+        automaton = ahocorasick.Automaton()
+        for category, words in words_by_category.items():
+            for word in words:
+                automaton.add_word(word.lower(), (word.lower(), category))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _iter_keywords(automaton, text):
+        """Yield (word, category) keyword matches in a single pass over the text"""
+        for end_index, (word, category) in automaton.iter(text):
+            start_index = end_index - len(word) + 1
+            # Keep the regex \b semantics: reject matches inside larger words
+            if start_index > 0 and text[start_index - 1].isalnum():
+                continue
+            if end_index + 1 < len(text) and text[end_index + 1].isalnum():
+                continue
+            yield word, category
+
+    @classmethod
+    def _find_keywords(cls, automaton, text):
+        """Find all whole-word keyword matches in the text"""
+        return list(cls._iter_keywords(automaton, text))
+
+    @classmethod
+    def _find_first_keyword(cls, automaton, text):
+        """Return the first whole-word keyword match, stopping the scan early"""
+        for match in cls._iter_keywords(automaton, text):
+            return match
+        return None
 
     def validate_content(self, text: str, user_id: str = "anonymous") -> dict:
         """
@@ -136,8 +257,28 @@ class TravelSecurityValidator:
 
         text_clean = text.strip().lower()
 
+        # Validation is a pure function of the normalized text, so cache hits
+        # skip all scanning work; logging and per-user fields stay out here
+        result = dict(self._validate_clean(text_clean))
+
+        if result["action"] == "block":
+            security_logger.warning(
+                f"Security threat detected - User: {user_id}, Category: {result.get('category')}")
+        elif result["action"] == "redirect":
+            result["suggestion"] = self._get_travel_suggestion()
+            travel_logger.info(
+                f"Non-travel query blocked - User: {user_id}, Category: {result.get('category')}, "
+                f"Score: {result['travel_score']:.2f}")
+        else:
+            travel_logger.info(f"Travel query approved - User: {user_id}, Score: {result['travel_score']:.2f}")
+
+        return result
+
+    @functools.lru_cache(maxsize=4096)
+    def _validate_clean(self, text_clean: str) -> dict:
+        """Validate pre-normalized text (cached; must stay free of side effects)"""
         # 1. Security threat check
-        security_result = self._check_security_threats(text_clean, user_id)
+        security_result = self._check_security_threats(text_clean)
         if not security_result["is_safe"]:
             return {
                 "is_safe": False,
@@ -154,21 +295,16 @@ class TravelSecurityValidator:
         if travel_score < 0.3:  # Travel relevance threshold
             non_travel_category = self._detect_non_travel_category(text_clean)
 
-            travel_logger.info(
-                f"Non-travel query blocked - User: {user_id}, Category: {non_travel_category}, Score: {travel_score:.2f}")
-
             return {
                 "is_safe": True,
                 "is_travel": False,
                 "action": "redirect",
                 "reason": "non_travel_topic",
                 "category": non_travel_category,
-                "travel_score": travel_score,
-                "suggestion": self._get_travel_suggestion()
+                "travel_score": travel_score
             }
 
         # Content is safe and travel-related
-        travel_logger.info(f"Travel query approved - User: {user_id}, Score: {travel_score:.2f}")
         return {
             "is_safe": True,
             "is_travel": True,
@@ -177,19 +313,17 @@ class TravelSecurityValidator:
             "travel_score": travel_score
         }
 
-    def _check_security_threats(self, text: str, user_id: str) -> dict:
+    def _check_security_threats(self, text: str) -> dict:
         """Check for security threats and inappropriate content"""
-        for category, pattern in self.threat_patterns.items():
-            matches = pattern.findall(text)
-            if matches:
-                security_logger.warning(
-                    f"Security threat detected - User: {user_id}, Category: {category}, Matches: {matches}")
-                return {
-                    "is_safe": False,
-                    "category": category,
-                    "matches": matches,
-                    "severity": "critical" if category == "high_threat" else "moderate"
-                }
+        hit = self._find_first_keyword(self.threat_automaton, text)
+        if hit:
+            word, category = hit
+            return {
+                "is_safe": False,
+                "category": category,
+                "matches": [word],
+                "severity": "critical" if category == "high_threat" else "moderate"
+            }
         return {"is_safe": True}
 
     def _calculate_travel_relevance(self, text: str) -> float:
@@ -198,56 +332,102 @@ class TravelSecurityValidator:
         if not words:
             return 0.0
 
-        travel_matches = len(self.travel_pattern.findall(text))
+        # Tokenize once and count hits via hashed set membership
+        tokens = self.token_pattern.findall(text)
+
+        # Fast path: obviously off-topic text skips the phrase scans entirely
+        if not self._hot_travel_tokens.intersection(tokens):
+            return 0.0
+
+        travel_matches = sum(1 for token in tokens if token in self.travel_word_set)
+        travel_matches += sum(1 for phrase in self.travel_multiword if phrase in text)
         total_words = len(words)
 
         # Base score from keyword matches
         keyword_score = min(travel_matches / max(total_words * 0.3, 1), 1.0)
 
-        # Boost for travel-specific patterns
-        travel_patterns = [
-            r'\b(?:trip to|travel to|visit|vacation in|holiday in)\b',
-            r'\b(?:hotel in|stay in|accommodation in)\b',
-            r'\b(?:attractions in|things to do in)\b',
-            r'\b(?:budget for|cost of).+(?:trip|travel|vacation)\b',
-            r'\b(?:weather in|climate in|best time to visit)\b'
-        ]
-
-        pattern_boost = 0.0
-        for pattern in travel_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                pattern_boost += 0.2
+        # Boost for travel-specific phrases, found in a single pass
+        pattern_boost = 0.2 * len(self.phrase_boost_pattern.findall(text))
 
         return min(keyword_score + pattern_boost, 1.0)
 
     def _detect_non_travel_category(self, text: str) -> str:
         """Detect category of non-travel topic"""
-        for category, pattern in self.non_travel_patterns.items():
-            if pattern.search(text):
-                return category
+        hit = self._find_first_keyword(self.non_travel_automaton, text)
+        if hit:
+            return hit[1]
         return "other_non_travel"
 
     def _get_travel_suggestion(self) -> str:
         """Get helpful travel-focused suggestion"""
-        suggestions = [
-            "Try asking about hotels, attractions, or itineraries for your destination!",
-            "I can help you plan trips - ask about destinations, budgets, or travel recommendations!",
-            "Let's focus on travel planning - ask me about accommodations, activities, or trip costs!",
-            "Ask me about travel topics like finding hotels, creating itineraries, or budgeting for trips!"
-        ]
-        import random
-        return random.choice(suggestions)
+        return random.choice(self.SUGGESTIONS)
 
 
-# Initialize security validator
+# Compile the shared keyword structures once at import, then initialize the
+# (stateless) validator facade
+TravelSecurityValidator._compile_patterns()
 security_validator = TravelSecurityValidator()
 
+def _build_city_index(df, sort_by=None, ascending=None):
+    """Index dataset rows by lowercased city for O(1) lookup at request time
+
+    Rows are pre-sorted once here so request handlers can slice the top-K
+    directly; filtering preserves the stored order.
+    """
+    if df.empty:
+        return {}
+    if sort_by:
+        df = df.sort_values(sort_by, ascending=ascending)
+    return {city_key: group.to_dict('records')
+            for city_key, group in df.groupby(df['city'].str.lower())}
+
+
+def _lnrm(name):
+    """Lowercase-normalize a name: strip accents, collapse non-alphanumerics"""
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', ' ', ascii_name.lower()).strip()
+
+
+def _build_lnrm_index(names):
+    """Map normalized city forms back to their canonical dataset keys"""
+    return {_lnrm(name): name for name in names}
+
+
+def _resolve_city_key(city, lnrm_index):
+    """Resolve a user-typed city against an index, tolerating small typos
+
+    Exact normalized lookup first; on a miss, fall back to the nearest
+    indexed city within Levenshtein distance 2. Returns the canonical key
+    or None.
+    """
+    normalized = _lnrm(city)
+    key = lnrm_index.get(normalized)
+    if key is None and normalized:
+        match = rapidfuzz.process.extractOne(
+            normalized, lnrm_index.keys(),
+            scorer=rapidfuzz.distance.Levenshtein.distance,
+            score_cutoff=2)
+        if match:
+            key = lnrm_index[match[0]]
+    return key
+
+
 # Load travel datasets
 try:
     hotels_df = pd.read_csv('travel_hotels.csv')
+    # Split delimited columns once at load; the data never changes per request
+    hotels_df['amenities'] = hotels_df['amenities'].str.split(',')
+    # Normalize once at load so per-query comparisons need no lowercase pass
+    hotels_df['category_key'] = hotels_df['category'].str.lower()
     attractions_df = pd.read_csv('travel_attractions.csv')
-    with open('travel_itinerary_templates.json', 'r') as f:
-        itinerary_templates = json.load(f)
+    # Low-cardinality string columns become categoricals: comparisons and
+    # groupbys work on integer codes instead of Python string objects
+    for _column in ('city', 'country'):
+        hotels_df[_column] = hotels_df[_column].astype('category')
+    for _column in ('city', 'country', 'category'):
+        attractions_df[_column] = attractions_df[_column].astype('category')
+    with open('travel_itinerary_templates.json', 'rb') as f:
+        itinerary_templates = orjson.loads(f.read())
     logger.info("Travel datasets loaded successfully!")
 except Exception as e:
     logger.error(f"Error loading datasets: {e}")
@@ -255,11 +435,201 @@ except Exception as e:
     attractions_df = pd.DataFrame()
     itinerary_templates = {}
 
+# Pre-indexed, read-only lookups so requests never re-scan the DataFrames;
+# sorted by rating (desc) then cost (asc), matching the response ranking
+HOTELS_BY_CITY = _build_city_index(hotels_df, ['rating', 'price_per_night'], [False, True])
+ATTRACTIONS_BY_CITY = _build_city_index(attractions_df, ['rating', 'entry_fee'], [False, True])
+
+def _build_destinations_cache():
+    """Precompute the destinations listing; the datasets are fixed per process"""
+    destinations = []
+    for city_key in sorted(HOTELS_BY_CITY):
+        rows = HOTELS_BY_CITY[city_key]
+        destinations.append({
+            'city': rows[0]['city'],
+            'country': rows[0]['country'],
+            'hotels_available': len(rows),
+            'attractions_available': len(ATTRACTIONS_BY_CITY.get(city_key, []))
+        })
+    return destinations
+
+
+_DESTINATIONS_CACHE = _build_destinations_cache()
+
+# Valid attraction categories, computed once instead of per request
+ATTRACTION_CATEGORIES = sorted(attractions_df['category'].unique().tolist()) if not attractions_df.empty else []
+
+# Normalized-name indexes shared by every city-keyed lookup path
+_HOTEL_CITY_LNRM = _build_lnrm_index(HOTELS_BY_CITY)
+_ATTRACTION_CITY_LNRM = _build_lnrm_index(ATTRACTIONS_BY_CITY)
+_TEMPLATE_CITY_LNRM = _build_lnrm_index(itinerary_templates)
+
+
+# Comprehensive weather database
+WEATHER_DATA = {
+    "Paris": {
+        "best_months": ["April", "May", "June", "September", "October"],
+        "good_months": ["March", "July", "August"],
+        "avoid_months": ["December", "January", "February"],
+        "weather_info": "Mild temperatures, moderate rainfall, perfect for sightseeing",
+        "peak_season": "May-September",
+        "temperature_range": "3°C to 25°C (37°F to 77°F)",
+        "rainfall": "Moderate year-round, heaviest in winter"
+    },
+    "London": {
+        "best_months": ["May", "June", "July", "August", "September"],
+        "good_months": ["April", "October"],
+        "avoid_months": ["November", "December", "January", "February"],
+        "weather_info": "Mild summers, rainy winters, longer daylight hours in summer",
+        "peak_season": "June-August",
+        "temperature_range": "2°C to 23°C (36°F to 73°F)",
+        "rainfall": "Year-round, but less in summer"
+    },
+    "Tokyo": {
+        "best_months": ["March", "April", "May", "October", "November"],
+        "good_months": ["February", "December"],
+        "avoid_months": ["June", "July", "August", "September"],
+        "weather_info": "Cherry blossom season (March-May) and pleasant autumn weather",
+        "peak_season": "March-May, October-November",
+        "temperature_range": "0°C to 30°C (32°F to 86°F)",
+        "rainfall": "Rainy season June-July, typhoons August-September"
+    },
+    "New York": {
+        "best_months": ["April", "May", "June", "September", "October"],
+        "good_months": ["March", "November"],
+        "avoid_months": ["January", "February", "July", "August"],
+        "weather_info": "Four distinct seasons, hot humid summers, cold winters",
+        "peak_season": "April-June, September-November",
+        "temperature_range": "-3°C to 29°C (27°F to 85°F)",
+        "rainfall": "Fairly distributed year-round"
+    },
+    "Dubai": {
+        "best_months": ["November", "December", "January", "February", "March"],
+        "good_months": ["April", "October"],
+        "avoid_months": ["June", "July", "August", "September"],
+        "weather_info": "Desert climate, very hot summers, mild winters",
+        "peak_season": "November-March",
+        "temperature_range": "14°C to 41°C (57°F to 106°F)",
+        "rainfall": "Very low, occasional winter showers"
+    },
+    "Barcelona": {
+        "best_months": ["April", "May", "June", "September", "October"],
+        "good_months": ["March", "July", "November"],
+        "avoid_months": ["December", "January", "February"],
+        "weather_info": "Mediterranean climate, warm dry summers, mild winters",
+        "peak_season": "May-September",
+        "temperature_range": "8°C to 28°C (46°F to 82°F)",
+        "rainfall": "Low, mainly in autumn and spring"
+    },
+    "Rome": {
+        "best_months": ["April", "May", "June", "September", "October"],
+        "good_months": ["March", "November"],
+        "avoid_months": ["July", "August", "December", "January"],
+        "weather_info": "Mediterranean climate, hot summers, mild winters",
+        "peak_season": "April-June, September-October",
+        "temperature_range": "3°C to 30°C (37°F to 86°F)",
+        "rainfall": "Wettest in autumn and winter"
+    },
+    "Bangkok": {
+        "best_months": ["November", "December", "January", "February"],
+        "good_months": ["March", "October"],
+        "avoid_months": ["April", "May", "June", "July", "August", "September"],
+        "weather_info": "Tropical climate, hot and humid with distinct rainy season",
+        "peak_season": "November-February",
+        "temperature_range": "22°C to 35°C (72°F to 95°F)",
+        "rainfall": "Heavy monsoon May-October"
+    },
+    "Sydney": {
+        "best_months": ["September", "October", "November", "March", "April", "May"],
+        "good_months": ["February", "June"],
+        "avoid_months": ["July", "August"],
+        "weather_info": "Temperate climate, warm summers, mild winters (Southern Hemisphere)",
+        "peak_season": "September-November, March-May",
+        "temperature_range": "8°C to 26°C (46°F to 79°F)",
+        "rainfall": "Fairly even year-round, slightly more in autumn/winter"
+    },
+    "Mumbai": {
+        "best_months": ["November", "December", "January", "February", "March"],
+        "good_months": ["October", "April"],
+        "avoid_months": ["June", "July", "August", "September"],
+        "weather_info": "Tropical climate, intense monsoon season, hot and humid",
+        "peak_season": "November-February",
+        "temperature_range": "16°C to 38°C (61°F to 100°F)",
+        "rainfall": "Heavy monsoon June-September"
+    }
+}
+
+# Default data for cities not in database
+DEFAULT_WEATHER = {
+    "best_months": ["April", "May", "September", "October"],
+    "good_months": ["March", "June", "November"],
+    "avoid_months": ["December", "January", "February"],
+    "weather_info": "Generally pleasant weather for travel",
+    "peak_season": "April-October",
+    "temperature_range": "Variable",
+    "rainfall": "Seasonal variation"
+}
+
+VALID_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+_VALID_MONTH_SET = frozenset(VALID_MONTHS)
+_MONTH_IDX = {month: index for index, month in enumerate(VALID_MONTHS)}
+
+
+def _month_mask(months):
+    """Pack a month list into a 12-bit mask (bit i set for month i)"""
+    mask = 0
+    for month in months:
+        mask |= 1 << _MONTH_IDX[month]
+    return mask
+
+
+def _build_weather_lookup():
+    """Precompute month ratings and frozen response fragments per city
+
+    Keyed by city name, with None holding the fallback entry for cities
+    outside the database; request handlers then only do dict lookups.
+    Month sets are packed into 12-bit masks so classification is a couple
+    of bit tests instead of list scans.
+    """
+    masks, details, tips, best3 = {}, {}, {}, {}
+    for city, city_weather in list(WEATHER_DATA.items()) + [(None, DEFAULT_WEATHER)]:
+        best = city_weather["best_months"]
+        good = city_weather.get("good_months", [])
+        avoid = city_weather.get("avoid_months", [])
+        masks[city] = (_month_mask(best), _month_mask(good), _month_mask(avoid))
+        details[city] = {
+            "best_months": best,
+            "good_months": good,
+            "avoid_months": avoid,
+            "weather_info": city_weather["weather_info"],
+            "peak_season": city_weather.get("peak_season", ""),
+            "temperature_range": city_weather.get("temperature_range", ""),
+            "rainfall_info": city_weather.get("rainfall", "")
+        }
+        tips[city] = [
+            f"Peak season: {city_weather.get('peak_season', 'N/A')} - expect higher prices and crowds",
+            f"Best weather: {', '.join(best)}",
+            f"Temperature range: {city_weather.get('temperature_range', 'Variable')}",
+            "Book accommodations early during peak months"
+        ]
+        best3[city] = ', '.join(best[:3])
+    return masks, details, tips, best3
+
+
+_MONTH_MASKS_BY_CITY, _WEATHER_DETAILS_BY_CITY, _TIPS_BY_CITY, _BEST3_BY_CITY = _build_weather_lookup()
+_WEATHER_CITY_LNRM = _build_lnrm_index(WEATHER_DATA)
+
 
 class TravelPlannerFunctions:
-    """Advanced travel planning functions with comprehensive features"""
+    """Advanced travel planning functions with comprehensive features
+
+    Search results are memoized against the read-only datasets; callers
+    must treat returned structures as read-only.
+    """
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def search_hotels(city: str, budget_max: int = None, category: str = None, check_availability: bool = True):
         """
         Search for hotels with advanced filtering
@@ -279,14 +649,16 @@ class TravelPlannerFunctions:
 
             city = city.strip().title()
 
-            if hotels_df.empty:
+            if not HOTELS_BY_CITY:
                 return {"error": "Hotel database is currently unavailable"}
 
-            # Filter by city (case-insensitive)
-            city_hotels = hotels_df[hotels_df['city'].str.lower() == city.lower()]
+            # O(1) lookup on the pre-indexed dataset, tolerating typos and
+            # accented spellings via the normalized index
+            city_key = _resolve_city_key(city, _HOTEL_CITY_LNRM)
+            city_hotels = HOTELS_BY_CITY.get(city_key, []) if city_key else []
 
-            if city_hotels.empty:
-                available_cities = sorted(hotels_df['city'].unique().tolist())
+            if not city_hotels:
+                available_cities = sorted(rows[0]['city'] for rows in HOTELS_BY_CITY.values())
                 return {
                     "error": f"No hotels found in {city}",
                     "available_cities": available_cities,
@@ -297,57 +669,58 @@ class TravelPlannerFunctions:
             if budget_max:
                 if not isinstance(budget_max, int) or budget_max < 0 or budget_max > 5000:
                     return {"error": "Budget must be a positive integer between 0 and 5000 USD"}
-                city_hotels = city_hotels[city_hotels['price_per_night'] <= budget_max]
+                city_hotels = [h for h in city_hotels if h['price_per_night'] <= budget_max]
 
             if category:
                 valid_categories = ['luxury', 'mid-range', 'budget']
-                if category.lower() not in valid_categories:
+                category_key = category.lower()
+                if category_key not in valid_categories:
                     return {"error": f"Category must be one of: {', '.join(valid_categories)}"}
-                city_hotels = city_hotels[city_hotels['category'].str.lower() == category.lower()]
+                city_hotels = [h for h in city_hotels if h['category_key'] == category_key]
 
             if check_availability:
-                city_hotels = city_hotels[city_hotels['availability'] == True]
+                city_hotels = [h for h in city_hotels if h['availability']]
 
-            if city_hotels.empty:
+            if not city_hotels:
                 return {
                     "error": f"No hotels found matching your criteria in {city}",
                     "suggestion": "Try adjusting your budget or category preferences"
                 }
 
-            # Sort by rating and select top results
-            results = city_hotels.sort_values(['rating', 'price_per_night'], ascending=[False, True]).head(8)
-
-            hotels_list = []
-            for _, hotel in results.iterrows():
-                hotels_list.append({
-                    'id': hotel['hotel_id'],
-                    'name': hotel['name'],
-                    'category': hotel['category'],
-                    'price_per_night': int(hotel['price_per_night']),
-                    'rating': float(hotel['rating']),
-                    'amenities': hotel['amenities'].split(','),
-                    'address': hotel['address'],
-                    'available': bool(hotel['availability']),
-                    'country': hotel['country']
-                })
-
-            # Calculate statistics
-            avg_price = int(results['price_per_night'].mean())
+            # Rows are stored pre-ranked, so the top results are a plain slice
+            results = city_hotels[:8]
+
+            hotels_list = [{
+                'id': hotel['hotel_id'],
+                'name': hotel['name'],
+                'category': hotel['category'],
+                'price_per_night': int(hotel['price_per_night']),
+                'rating': float(hotel['rating']),
+                'amenities': hotel['amenities'],
+                'address': hotel['address'],
+                'available': bool(hotel['availability']),
+                'country': hotel['country']
+            } for hotel in results]
+
+            # Calculate statistics in one extraction pass
+            prices = [h['price_per_night'] for h in results]
+            ratings = [h['rating'] for h in results]
+            avg_price = int(sum(prices) / len(prices))
             price_range = {
-                'min': int(results['price_per_night'].min()),
-                'max': int(results['price_per_night'].max())
+                'min': int(min(prices)),
+                'max': int(max(prices))
             }
 
             return {
                 "success": True,
                 "city": city,
-                "country": results.iloc[0]['country'],
+                "country": results[0]['country'],
                 "hotels_found": len(hotels_list),
                 "hotels": hotels_list,
                 "statistics": {
                     "average_price": avg_price,
                     "price_range": price_range,
-                    "average_rating": round(results['rating'].mean(), 1)
+                    "average_rating": round(sum(ratings) / len(ratings), 1)
                 },
                 "filters_applied": {
                     "budget_max": budget_max,
@@ -361,6 +734,7 @@ class TravelPlannerFunctions:
             return {"error": "Failed to search hotels. Please try again with valid parameters."}
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def get_attractions(city: str, category: str = None, max_entry_fee: int = None):
         """
         Get tourist attractions with filtering options
@@ -379,14 +753,16 @@ class TravelPlannerFunctions:
 
             city = city.strip().title()
 
-            if attractions_df.empty:
+            if not ATTRACTIONS_BY_CITY:
                 return {"error": "Attractions database is currently unavailable"}
 
-            # Filter by city
-            city_attractions = attractions_df[attractions_df['city'].str.lower() == city.lower()]
+            # O(1) lookup on the pre-indexed dataset, tolerating typos and
+            # accented spellings via the normalized index
+            city_key = _resolve_city_key(city, _ATTRACTION_CITY_LNRM)
+            city_attractions = ATTRACTIONS_BY_CITY.get(city_key, []) if city_key else []
 
-            if city_attractions.empty:
-                available_cities = sorted(attractions_df['city'].unique().tolist())
+            if not city_attractions:
+                available_cities = sorted(rows[0]['city'] for rows in ATTRACTIONS_BY_CITY.values())
                 return {
                     "error": f"No attractions found in {city}",
                     "available_cities": available_cities,
@@ -395,61 +771,72 @@ class TravelPlannerFunctions:
 
             # Apply filters
             if category:
-                available_categories = sorted(attractions_df['category'].unique().tolist())
-                if category not in available_categories:
+                if category not in ATTRACTION_CATEGORIES:
                     return {
                         "error": f"Invalid category '{category}'",
-                        "available_categories": available_categories
+                        "available_categories": ATTRACTION_CATEGORIES
                     }
-                city_attractions = city_attractions[city_attractions['category'] == category]
+                city_attractions = [a for a in city_attractions if a['category'] == category]
 
             if max_entry_fee is not None:
                 if not isinstance(max_entry_fee, int) or max_entry_fee < 0:
                     return {"error": "Maximum entry fee must be a non-negative integer"}
-                city_attractions = city_attractions[city_attractions['entry_fee'] <= max_entry_fee]
+                city_attractions = [a for a in city_attractions if a['entry_fee'] <= max_entry_fee]
 
-            if city_attractions.empty:
+            if not city_attractions:
                 return {
                     "error": f"No attractions found matching your criteria in {city}",
                     "suggestion": "Try adjusting your category or budget filters"
                 }
 
-            # Sort by rating and select top results
-            results = city_attractions.sort_values(['rating', 'entry_fee'], ascending=[False, True]).head(12)
-
-            attractions_list = []
-            for _, attraction in results.iterrows():
-                attractions_list.append({
-                    'id': attraction['attraction_id'],
-                    'name': attraction['name'],
-                    'category': attraction['category'],
-                    'entry_fee': int(attraction['entry_fee']),
-                    'duration_hours': float(attraction['duration_hours']),
-                    'rating': float(attraction['rating']),
-                    'description': attraction['description'],
-                    'opening_hours': attraction['opening_hours'],
-                    'country': attraction['country']
-                })
-
-            # Group by category for better organization
-            categories_summary = results.groupby('category').agg({
-                'attraction_id': 'count',
-                'entry_fee': 'mean',
-                'rating': 'mean'
-            }).round(1).to_dict('index')
+            # Rows are stored pre-ranked, so the top results are a plain slice
+            results = city_attractions[:12]
+
+            attractions_list = [{
+                'id': attraction['attraction_id'],
+                'name': attraction['name'],
+                'category': attraction['category'],
+                'entry_fee': int(attraction['entry_fee']),
+                'duration_hours': float(attraction['duration_hours']),
+                'rating': float(attraction['rating']),
+                'description': attraction['description'],
+                'opening_hours': attraction['opening_hours'],
+                'country': attraction['country']
+            } for attraction in results]
+
+            # Single extraction pass for the statistics below
+            entry_fees = [a['entry_fee'] for a in results]
+            durations = [a['duration_hours'] for a in results]
+            attraction_ratings = [a['rating'] for a in results]
+
+            # Group by category for better organization (single pass, no pandas)
+            category_totals = {}
+            for attraction in results:
+                totals = category_totals.setdefault(attraction['category'], [0, 0.0, 0.0])
+                totals[0] += 1
+                totals[1] += attraction['entry_fee']
+                totals[2] += attraction['rating']
+            categories_summary = {
+                cat: {
+                    'attraction_id': count,
+                    'entry_fee': round(fee_sum / count, 1),
+                    'rating': round(rating_sum / count, 1)
+                }
+                for cat, (count, fee_sum, rating_sum) in category_totals.items()
+            }
 
             return {
                 "success": True,
                 "city": city,
-                "country": results.iloc[0]['country'],
+                "country": results[0]['country'],
                 "attractions_found": len(attractions_list),
                 "attractions": attractions_list,
                 "categories_summary": categories_summary,
                 "statistics": {
-                    "average_entry_fee": int(results['entry_fee'].mean()),
-                    "free_attractions": len(results[results['entry_fee'] == 0]),
-                    "average_duration": round(results['duration_hours'].mean(), 1),
-                    "average_rating": round(results['rating'].mean(), 1)
+                    "average_entry_fee": int(sum(entry_fees) / len(entry_fees)),
+                    "free_attractions": entry_fees.count(0),
+                    "average_duration": round(sum(durations) / len(durations), 1),
+                    "average_rating": round(sum(attraction_ratings) / len(attraction_ratings), 1)
                 },
                 "filters_applied": {
                     "category": category,
@@ -462,6 +849,7 @@ class TravelPlannerFunctions:
             return {"error": "Failed to get attractions. Please try again with valid parameters."}
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def create_itinerary(city: str, duration_days: int, interests: str = None):
         """
         Create detailed travel itinerary
@@ -483,9 +871,10 @@ class TravelPlannerFunctions:
 
             city = city.strip().title()
 
-            # Check for pre-built templates
-            if city in itinerary_templates and f"{duration_days}_days" in itinerary_templates[city]:
-                template_itinerary = itinerary_templates[city][f"{duration_days}_days"]
+            # Check for pre-built templates (normalized city lookup)
+            template_city = _resolve_city_key(city, _TEMPLATE_CITY_LNRM)
+            if template_city and f"{duration_days}_days" in itinerary_templates[template_city]:
+                template_itinerary = itinerary_templates[template_city][f"{duration_days}_days"]
 
                 total_cost = sum(day['estimated_cost'] for day in template_itinerary)
 
@@ -520,37 +909,20 @@ class TravelPlannerFunctions:
             # Group attractions by category for variety
             categorized_attractions = {}
             for attraction in attractions:
-                category = attraction['category']
-                if category not in categorized_attractions:
-                    categorized_attractions[category] = []
-                categorized_attractions[category].append(attraction)
+                categorized_attractions.setdefault(attraction['category'], []).append(attraction)
 
-            # Distribute attractions across days
-            used_attractions = set()
+            # Interleave categories round-robin once, then consume in order;
+            # a single O(N) pass replaces the per-day rescans of unused items
+            rotation = [attraction
+                        for group in itertools.zip_longest(*categorized_attractions.values())
+                        for attraction in group if attraction is not None]
+            attraction_queue = iter(rotation)
+            attractions_used = 0
 
             for day in range(1, duration_days + 1):
-                day_attractions = []
-                day_cost = 50  # Base cost for meals and transport
-
-                # Try to get diverse attractions for each day
-                for category in categorized_attractions:
-                    available = [a for a in categorized_attractions[category]
-                                 if a['id'] not in used_attractions]
-                    if available and len(day_attractions) < attractions_per_day:
-                        selected = available[0]
-                        day_attractions.append(selected)
-                        used_attractions.add(selected['id'])
-                        day_cost += selected['entry_fee']
-
-                # Fill remaining slots if needed
-                while len(day_attractions) < attractions_per_day:
-                    remaining = [a for a in attractions if a['id'] not in used_attractions]
-                    if not remaining:
-                        break
-                    selected = remaining[0]
-                    day_attractions.append(selected)
-                    used_attractions.add(selected['id'])
-                    day_cost += selected['entry_fee']
+                day_attractions = list(itertools.islice(attraction_queue, attractions_per_day))
+                day_cost = 50 + sum(attr['entry_fee'] for attr in day_attractions)  # Base cost for meals and transport
+                attractions_used += len(day_attractions)
 
                 # Create day plan
                 day_plan = {
@@ -576,7 +948,7 @@ class TravelPlannerFunctions:
                 "itinerary": itinerary,
                 "total_estimated_cost": total_cost,
                 "daily_average_cost": round(total_cost / duration_days, 2),
-                "attractions_included": len(used_attractions),
+                "attractions_included": attractions_used,
                 "customization": {
                     "interests": interests,
                     "variety_achieved": len(categorized_attractions)
@@ -589,6 +961,7 @@ class TravelPlannerFunctions:
             return {"error": "Failed to create itinerary. Please try again with valid parameters."}
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def get_travel_budget_estimate(city: str, duration_days: int, accommodation_category: str = "mid-range"):
         """
         Calculate comprehensive travel budget
@@ -720,6 +1093,7 @@ class TravelPlannerFunctions:
             return {"error": "Failed to estimate budget. Please try again with valid parameters."}
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def check_weather_recommendation(city: str, travel_month: str):
         """
         Get weather-based travel recommendations
@@ -742,132 +1116,37 @@ class TravelPlannerFunctions:
             travel_month = travel_month.strip().title()
 
             # Validate month
-            valid_months = ['January', 'February', 'March', 'April', 'May', 'June',
-                            'July', 'August', 'September', 'October', 'November', 'December']
-
-            if travel_month not in valid_months:
-                return {"error": f"Invalid month. Must be one of: {', '.join(valid_months)}"}
-
-            # Comprehensive weather database
-            weather_data = {
-                "Paris": {
-                    "best_months": ["April", "May", "June", "September", "October"],
-                    "good_months": ["March", "July", "August"],
-                    "avoid_months": ["December", "January", "February"],
-                    "weather_info": "Mild temperatures, moderate rainfall, perfect for sightseeing",
-                    "peak_season": "May-September",
-                    "temperature_range": "3°C to 25°C (37°F to 77°F)",
-                    "rainfall": "Moderate year-round, heaviest in winter"
-                },
-                "London": {
-                    "best_months": ["May", "June", "July", "August", "September"],
-                    "good_months": ["April", "October"],
-                    "avoid_months": ["November", "December", "January", "February"],
-                    "weather_info": "Mild summers, rainy winters, longer daylight hours in summer",
-                    "peak_season": "June-August",
-                    "temperature_range": "2°C to 23°C (36°F to 73°F)",
-                    "rainfall": "Year-round, but less in summer"
-                },
-                "Tokyo": {
-                    "best_months": ["March", "April", "May", "October", "November"],
-                    "good_months": ["February", "December"],
-                    "avoid_months": ["June", "July", "August", "September"],
-                    "weather_info": "Cherry blossom season (March-May) and pleasant autumn weather",
-                    "peak_season": "March-May, October-November",
-                    "temperature_range": "0°C to 30°C (32°F to 86°F)",
-                    "rainfall": "Rainy season June-July, typhoons August-September"
-                },
-                "New York": {
-                    "best_months": ["April", "May", "June", "September", "October"],
-                    "good_months": ["March", "November"],
-                    "avoid_months": ["January", "February", "July", "August"],
-                    "weather_info": "Four distinct seasons, hot humid summers, cold winters",
-                    "peak_season": "April-June, September-November",
-                    "temperature_range": "-3°C to 29°C (27°F to 85°F)",
-                    "rainfall": "Fairly distributed year-round"
-                },
-                "Dubai": {
-                    "best_months": ["November", "December", "January", "February", "March"],
-                    "good_months": ["April", "October"],
-                    "avoid_months": ["June", "July", "August", "September"],
-                    "weather_info": "Desert climate, very hot summers, mild winters",
-                    "peak_season": "November-March",
-                    "temperature_range": "14°C to 41°C (57°F to 106°F)",
-                    "rainfall": "Very low, occasional winter showers"
-                },
-                "Barcelona": {
-                    "best_months": ["April", "May", "June", "September", "October"],
-                    "good_months": ["March", "July", "November"],
-                    "avoid_months": ["December", "January", "February"],
-                    "weather_info": "Mediterranean climate, warm dry summers, mild winters",
-                    "peak_season": "May-September",
-                    "temperature_range": "8°C to 28°C (46°F to 82°F)",
-                    "rainfall": "Low, mainly in autumn and spring"
-                },
-                "Rome": {
-                    "best_months": ["April", "May", "June", "September", "October"],
-                    "good_months": ["March", "November"],
-                    "avoid_months": ["July", "August", "December", "January"],
-                    "weather_info": "Mediterranean climate, hot summers, mild winters",
-                    "peak_season": "April-June, September-October",
-                    "temperature_range": "3°C to 30°C (37°F to 86°F)",
-                    "rainfall": "Wettest in autumn and winter"
-                },
-                "Bangkok": {
-                    "best_months": ["November", "December", "January", "February"],
-                    "good_months": ["March", "October"],
-                    "avoid_months": ["April", "May", "June", "July", "August", "September"],
-                    "weather_info": "Tropical climate, hot and humid with distinct rainy season",
-                    "peak_season": "November-February",
-                    "temperature_range": "22°C to 35°C (72°F to 95°F)",
-                    "rainfall": "Heavy monsoon May-October"
-                },
-                "Sydney": {
-                    "best_months": ["September", "October", "November", "March", "April", "May"],
-                    "good_months": ["February", "June"],
-                    "avoid_months": ["July", "August"],
-                    "weather_info": "Temperate climate, warm summers, mild winters (Southern Hemisphere)",
-                    "peak_season": "September-November, March-May",
-                    "temperature_range": "8°C to 26°C (46°F to 79°F)",
-                    "rainfall": "Fairly even year-round, slightly more in autumn/winter"
-                },
-                "Mumbai": {
-                    "best_months": ["November", "December", "January", "February", "March"],
-                    "good_months": ["October", "April"],
-                    "avoid_months": ["June", "July", "August", "September"],
-                    "weather_info": "Tropical climate, intense monsoon season, hot and humid",
-                    "peak_season": "November-February",
-                    "temperature_range": "16°C to 38°C (61°F to 100°F)",
-                    "rainfall": "Heavy monsoon June-September"
-                }
-            }
-
-            # Default data for cities not in database
-            default_weather = {
-                "best_months": ["April", "May", "September", "October"],
-                "good_months": ["March", "June", "November"],
-                "avoid_months": ["December", "January", "February"],
-                "weather_info": "Generally pleasant weather for travel",
-                "peak_season": "April-October",
-                "temperature_range": "Variable",
-                "rainfall": "Seasonal variation"
-            }
-
-            city_weather = weather_data.get(city, default_weather)
-
-            # Determine recommendation level
-            if travel_month in city_weather["best_months"]:
+            if travel_month not in _VALID_MONTH_SET:
+                return {"error": f"Invalid month. Must be one of: {', '.join(VALID_MONTHS)}"}
+
+            # All weather knowledge is precomputed at import; the normalized
+            # index absorbs typos and unknown cities fall back to the
+            # default entry under the None key
+            lookup_city = _resolve_city_key(city, _WEATHER_CITY_LNRM)
+            if lookup_city:
+                city = lookup_city
+
+            # Determine recommendation level via bit tests on the month masks
+            best_mask, good_mask, avoid_mask = _MONTH_MASKS_BY_CITY[lookup_city]
+            month_bit = 1 << _MONTH_IDX[travel_month]
+            if best_mask & month_bit:
                 recommendation_level = "excellent"
-                recommendation = f"Excellent time to visit {city}! {travel_month} is one of the best months."
-            elif travel_month in city_weather.get("good_months", []):
+            elif good_mask & month_bit:
                 recommendation_level = "good"
-                recommendation = f"Good time to visit {city}. {travel_month} offers decent weather conditions."
-            elif travel_month in city_weather.get("avoid_months", []):
+            elif avoid_mask & month_bit:
                 recommendation_level = "not_recommended"
-                recommendation = f"Not the ideal time for {city}. Consider visiting during: {', '.join(city_weather['best_months'][:3])}"
             else:
                 recommendation_level = "fair"
-                recommendation = f"Fair time to visit {city}, though {', '.join(city_weather['best_months'][:3])} would be better."
+            best3 = _BEST3_BY_CITY[lookup_city]
+
+            if recommendation_level == "excellent":
+                recommendation = f"Excellent time to visit {city}! {travel_month} is one of the best months."
+            elif recommendation_level == "good":
+                recommendation = f"Good time to visit {city}. {travel_month} offers decent weather conditions."
+            elif recommendation_level == "not_recommended":
+                recommendation = f"Not the ideal time for {city}. Consider visiting during: {best3}"
+            else:
+                recommendation = f"Fair time to visit {city}, though {best3} would be better."
 
             return {
                 "success": True,
@@ -875,21 +1154,8 @@ class TravelPlannerFunctions:
                 "travel_month": travel_month,
                 "recommendation_level": recommendation_level,
                 "recommendation": recommendation,
-                "weather_details": {
-                    "best_months": city_weather["best_months"],
-                    "good_months": city_weather.get("good_months", []),
-                    "avoid_months": city_weather.get("avoid_months", []),
-                    "weather_info": city_weather["weather_info"],
-                    "peak_season": city_weather.get("peak_season", ""),
-                    "temperature_range": city_weather.get("temperature_range", ""),
-                    "rainfall_info": city_weather.get("rainfall", "")
-                },
-                "travel_tips": [
-                    f"Peak season: {city_weather.get('peak_season', 'N/A')} - expect higher prices and crowds",
-                    f"Best weather: {', '.join(city_weather['best_months'])}",
-                    f"Temperature range: {city_weather.get('temperature_range', 'Variable')}",
-                    "Book accommodations early during peak months"
-                ]
+                "weather_details": _WEATHER_DETAILS_BY_CITY[lookup_city],
+                "travel_tips": _TIPS_BY_CITY[lookup_city]
             }
 
         except Exception as e:
@@ -1017,6 +1283,51 @@ travel_functions = [
     }
 ]
 
+# Frozen view passed to the API so the schema list cannot be mutated at runtime
+_FUNCTIONS_FROZEN = tuple(travel_functions)
+
+# Fully static endpoint bodies, encoded to JSON bytes once at import so the
+# hot GET endpoints skip per-request dict building and serialization
+_FUNCTIONS_RESPONSE_BYTES = orjson.dumps({
+    'functions': [
+        {
+            'name': func['name'],
+            'description': func['description'],
+            'parameters': func['parameters']
+        }
+        for func in travel_functions
+    ],
+    'scope': 'travel_planning_only'
+})
+_DESTINATIONS_RESPONSE_BYTES = orjson.dumps({
+    'success': True,
+    'destinations': _DESTINATIONS_CACHE,
+    'total_cities': len(_DESTINATIONS_CACHE)
+})
+
+# System prompt built once; every chat request reuses the same dict
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": """You are an expert travel planning assistant. You specialize EXCLUSIVELY in helping travelers plan amazing trips.
+
+Your capabilities include:
+1. Hotel and accommodation searches with detailed filtering
+2. Tourist attraction discovery and recommendations
+3. Comprehensive travel itinerary creation
+4. Accurate travel budget estimation
+5. Weather-based travel timing advice
+
+IMPORTANT GUIDELINES:
+- You ONLY help with travel-related queries
+- Use the available travel functions whenever appropriate
+- Provide detailed, helpful, and enthusiastic travel advice
+- Always prioritize user safety and practical travel recommendations
+- Include specific details like prices, ratings, and practical tips
+- Be conversational and engaging while remaining professional
+
+Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona, Rome, Bangkok, Sydney, and Mumbai with comprehensive data for each location."""
+}
+
 # Function mapping for execution
 function_mapping = {
     "search_hotels": TravelPlannerFunctions.search_hotels,
@@ -1026,20 +1337,131 @@ function_mapping = {
     "check_weather_recommendation": TravelPlannerFunctions.check_weather_recommendation
 }
 
-# Session storage for conversation management
-conversation_sessions = {}
+# Content-addressed cache of completed function-calling turns: identical
+# travel questions are answered without any OpenAI round-trips
+_response_cache = LRUCache(maxsize=5000)
+_response_cache_lock = threading.RLock()
+
+# Session storage for conversation management: bounded with a one-hour TTL
+# so session_id churn cannot grow memory without limit. TTLCache is not
+# thread-safe, so access goes through the lock under the threaded server.
+# With REDIS_URL set, sessions live in Redis instead, so Gunicorn workers
+# can scale out without sticky sessions and survive restarts
+_SESSION_TTL = 3600
+conversation_sessions = TTLCache(maxsize=10_000, ttl=_SESSION_TTL)
+_sessions_lock = threading.RLock()
+
+_REDIS_URL = os.environ.get('REDIS_URL')
+if _REDIS_URL:
+    import redis
+    _redis = redis.Redis.from_url(_REDIS_URL, max_connections=50)
+else:
+    _redis = None
+
+
+def _new_session():
+    """Build a fresh session record"""
+    return {
+        'messages': deque(maxlen=10),
+        'created_at': int(time.time()),
+        'message_count': 0,
+        'off_topic_warnings': 0,
+        'security_violations': 0
+    }
+
+
+def _load_session(session_id):
+    """Fetch a session from Redis or the in-process store, or None"""
+    if _redis is not None:
+        raw = _redis.get(f"sess:{session_id}")
+        if raw is None:
+            return None
+        session = orjson.loads(raw)
+        session['messages'] = deque(session['messages'], maxlen=10)
+        return session
+    with _sessions_lock:
+        return conversation_sessions.get(session_id)
+
+
+def _save_session(session_id, session):
+    """Persist a session; call after every request that mutated it
+
+    The in-process store holds live references, so saving there just
+    refreshes the TTL; Redis gets the record serialized with the history
+    deque flattened to a list.
+    """
+    if _redis is not None:
+        payload = dict(session, messages=list(session['messages']))
+        _redis.setex(f"sess:{session_id}", _SESSION_TTL, orjson.dumps(payload))
+    else:
+        with _sessions_lock:
+            conversation_sessions[session_id] = session
+
+
+def _delete_session(session_id):
+    """Drop a session from whichever store is active"""
+    if _redis is not None:
+        _redis.delete(f"sess:{session_id}")
+    else:
+        with _sessions_lock:
+            conversation_sessions.pop(session_id, None)
+
+# Static fragments of the off-topic redirect response, built once instead of
+# per request (the message itself varies with the per-session warning count)
+TRAVEL_EXAMPLES = (
+    "Find luxury hotels in Paris under $400",
+    "Create a 5-day Tokyo itinerary",
+    "What's the budget for a Barcelona trip?",
+    "Best attractions in London",
+    "Weather in Dubai in December"
+)
+OFF_TOPIC_SECOND_WARNING = ("I'm specifically designed for travel planning only. Please ask about destinations, "
+                            "hotels, attractions, itineraries, or travel budgets.")
+OFF_TOPIC_FINAL_WARNING = ("I can ONLY assist with travel planning. I cannot help with other topics. Please ask "
+                           "about: hotels, attractions, itineraries, travel budgets, or destination recommendations.")
+
+# Prompt budget for the history sent to OpenAI. The 10-message window alone
+# lets a few large function results bloat the prompt to 10+ KB, so the
+# history is additionally token-bounded before each call
+_HISTORY_TOKEN_BUDGET = 2000
+
+
+def _estimate_tokens(message):
+    """Rough token estimate for a chat message (~4 chars per token)
+
+    A heuristic keeps the hot path dependency-free; the budget only needs
+    to cap worst-case prompt size, not bill-accurate counts.
+    """
+    tokens = 4 + len(message.get('content') or '') // 4
+    function_call = message.get('function_call')
+    if function_call:
+        tokens += len(function_call.get('arguments') or '') // 4
+    return tokens
 
 
-def call_openai_with_functions(messages, session_id):
-    """Call OpenAI API with advanced function calling capabilities"""
+def _trim_history_to_budget(session):
+    """Drop the oldest history messages until the estimated total fits the budget"""
+    history = session['messages']
+    total = sum(_estimate_tokens(message) for message in history)
+    while history and total > _HISTORY_TOKEN_BUDGET:
+        total -= _estimate_tokens(history.popleft())
+
+
+def call_openai_with_functions(messages, session_id, stream=False):
+    """Call OpenAI API with advanced function calling capabilities
+
+    With stream=True the return value is the chunk iterator from the API
+    instead of a complete response object.
+    """
     try:
         response = openai.ChatCompletion.create(
             model="gpt-3.5-turbo",
             messages=messages,
-            functions=travel_functions,
+            functions=_FUNCTIONS_FROZEN,
             function_call="auto",
             temperature=0.7,
-            max_tokens=1000
+            max_tokens=1000,
+            stream=stream
         )
         return response
 
@@ -1054,6 +1476,220 @@ def call_openai_with_functions(messages, session_id):
         return None
 
 
+# Runs travel functions speculatively while the tail of a streamed OpenAI
+# response is still draining. Safe because every mapped function is pure
+# (and lru_cached), so a wasted speculative run costs a few ms at most
+_function_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='travel-fn')
+
+
+def _sse(payload):
+    """Format one Server-Sent Events frame"""
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
+
+
+def _call_travel_function(function_name, function_args):
+    """Invoke a mapped travel function, tolerating model-emitted bad arguments
+
+    The lru_cache wrappers hash the arguments before each function's own
+    try/except can run, so an unhashable value (e.g. a list where a string
+    belongs) or an invented keyword raises TypeError at the call itself.
+    Return the functions' usual error shape so the turn degrades into a
+    narratable error instead of a 500 or an aborted stream.
+    """
+    try:
+        return function_mapping[function_name](**function_args)
+    except TypeError as e:
+        logger.error(f"Invalid arguments for {function_name}: {e}")
+        return {"error": f"Invalid arguments for {function_name}. Please rephrase your travel request."}
+
+
+def _maybe_speculate(choice, function_name, function_args_parts):
+    """Kick off the travel function as soon as its streamed arguments complete
+
+    Returns (args, future) when the finish_reason chunk lands with valid
+    arguments for a known function, else (None, None); the caller falls
+    back to inline execution in that case.
+    """
+    if choice.get('finish_reason') == 'function_call' and function_name in function_mapping:
+        try:
+            function_args = json.loads(''.join(function_args_parts))
+        except json.JSONDecodeError:
+            return None, None
+        return function_args, _function_executor.submit(
+            _call_travel_function, function_name, function_args)
+    return None, None
+
+
+def _stream_chat(messages, session, session_id, user_message, cache_key):
+    """Stream a chat turn as Server-Sent Events
+
+    Content tokens are forwarded to the client as they arrive, so
+    time-to-first-byte is one chunk instead of the full generation.
+    Function calls are buffered (arguments must be complete before the
+    function can run), then the follow-up response streams as usual.
+
+    The whole generator runs inside one try block: chat()'s outer handler
+    cannot catch failures here (the body iterates after the view returns),
+    so errors surface as a terminal SSE frame instead of an aborted stream.
+    """
+    def generate():
+        try:
+            response = call_openai_with_functions(messages, session_id, stream=True)
+            if not response:
+                yield _sse({'error': 'Travel planning service temporarily unavailable. Please try again.'})
+                return
+
+            content_parts = []
+            function_name = None
+            function_args_parts = []
+            function_args = None
+            function_future = None
+            for chunk in response:
+                choice = chunk.choices[0]
+                delta = choice.delta
+                if delta.get('function_call'):
+                    function_call = delta['function_call']
+                    if function_call.get('name'):
+                        function_name = function_call['name']
+                    if function_call.get('arguments'):
+                        function_args_parts.append(function_call['arguments'])
+                elif delta.get('content'):
+                    content_parts.append(delta['content'])
+                    yield _sse({'delta': delta['content']})
+                if function_future is None:
+                    function_args, function_future = _maybe_speculate(
+                        choice, function_name, function_args_parts)
+
+            if function_name:
+                if function_name not in function_mapping:
+                    yield _sse({'error': f'Unknown travel function: {function_name}'})
+                    return
+                if function_future is None:
+                    yield _sse({'error': 'Invalid function call from AI'})
+                    return
+
+                logger.info(f"Travel function called: {function_name} with args: {function_args}")
+                function_result = function_future.result()
+
+                function_call_message = {
+                    "role": "assistant",
+                    "content": None,
+                    "function_call": {
+                        "name": function_name,
+                        "arguments": orjson.dumps(function_args).decode()
+                    }
+                }
+                function_result_message = {
+                    "role": "function",
+                    "name": function_name,
+                    "content": orjson.dumps(function_result).decode()
+                }
+                messages.append(function_call_message)
+                messages.append(function_result_message)
+
+                # Stream the follow-up response that narrates the result
+                final_response = call_openai_with_functions(messages, session_id, stream=True)
+                if final_response:
+                    for chunk in final_response:
+                        content = chunk.choices[0].delta.get('content')
+                        if content:
+                            content_parts.append(content)
+                            yield _sse({'delta': content})
+                    final_message = ''.join(content_parts)
+
+                    with _response_cache_lock:
+                        _response_cache[cache_key] = (final_message, function_name,
+                                                      function_args, function_result)
+
+                    session['messages'].extend([
+                        {"role": "user", "content": user_message},
+                        function_call_message,
+                        function_result_message,
+                        {"role": "assistant", "content": final_message}
+                    ])
+                else:
+                    final_message = (f"I found travel information for you! "
+                                     f"{function_result.get('message', 'Here are the details for your travel query.')}")
+                    yield _sse({'delta': final_message})
+                    session['messages'].extend([
+                        {"role": "user", "content": user_message},
+                        {"role": "assistant", "content": final_message}
+                    ])
+
+                _save_session(session_id, session)
+                yield _sse({
+                    'done': True,
+                    'message': final_message,
+                    'function_called': function_name,
+                    'function_result': function_result,
+                    'function_args': function_args,
+                    'session_id': session_id,
+                    'travel_query': True
+                })
+                return
+
+            final_message = ''.join(content_parts)
+            session['messages'].extend([
+                {"role": "user", "content": user_message},
+                {"role": "assistant", "content": final_message}
+            ])
+            _save_session(session_id, session)
+            yield _sse({
+                'done': True,
+                'message': final_message,
+                'session_id': session_id,
+                'travel_query': True
+            })
+
+        except Exception as e:
+            logger.error(f"Error in streaming chat: {e}")
+            yield _sse({
+                'error': 'Travel assistance temporarily unavailable. Please try again.',
+                'technical_error': str(e)
+            })
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+
+def _collect_first_call(messages, session_id):
+    """Run the first chat call streamed and speculate on the function call
+
+    Drains the streamed response into a buffer so the JSON path keeps its
+    shape, but submits the travel function to the executor the moment its
+    arguments finish arriving - overlapping the function run with the tail
+    of the stream instead of waiting for the full response first.
+
+    Returns (content, function_name, function_args, function_future), or
+    None when the API call failed. function_future is None when no valid
+    call for a known function arrived.
+    """
+    response = call_openai_with_functions(messages, session_id, stream=True)
+    if not response:
+        return None
+
+    content_parts = []
+    function_name = None
+    function_args_parts = []
+    function_args = None
+    function_future = None
+    for chunk in response:
+        choice = chunk.choices[0]
+        delta = choice.delta
+        if delta.get('function_call'):
+            function_call = delta['function_call']
+            if function_call.get('name'):
+                function_name = function_call['name']
+            if function_call.get('arguments'):
+                function_args_parts.append(function_call['arguments'])
+        elif delta.get('content'):
+            content_parts.append(delta['content'])
+        if function_future is None:
+            function_args, function_future = _maybe_speculate(
+                choice, function_name, function_args_parts)
+
+    return ''.join(content_parts), function_name, function_args, function_future
+
+
 @app.route('/')
 def home():
     """Serve the main travel chatbot interface"""
@@ -1064,7 +1700,7 @@ def home():
 def chat():
     """Main chat endpoint with comprehensive security and travel validation"""
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data() or b'{}')
         user_message = data.get('message', '').strip()
         session_id = data.get('session_id', 'default')
 
@@ -1072,17 +1708,11 @@ def chat():
             return jsonify({'error': 'No message provided'}), 400
 
         # Initialize session if not exists
-        if session_id not in conversation_sessions:
-            conversation_sessions[session_id] = {
-                'messages': [],
-                'created_at': datetime.now(),
-                'message_count': 0,
-                'off_topic_warnings': 0,
-                'security_violations': 0
-            }
-
-        session = conversation_sessions[session_id]
+        session = _load_session(session_id)
+        if session is None:
+            session = _new_session()
         session['message_count'] += 1
+        _save_session(session_id, session)
 
         # Rate limiting
         if session['message_count'] > 50:
@@ -1102,13 +1732,7 @@ def chat():
             # Auto-reset after security violations
             if session['security_violations'] >= 2:
                 # Clear session
-                conversation_sessions[session_id] = {
-                    'messages': [],
-                    'created_at': datetime.now(),
-                    'message_count': 0,
-                    'off_topic_warnings': 0,
-                    'security_violations': 0
-                }
+                _save_session(session_id, _new_session())
                 return jsonify({
                     'success': True,
                     'message': 'Chat has been reset due to security violations. Let\'s start fresh with safe travel planning!',
@@ -1116,6 +1740,7 @@ def chat():
                     'reason': 'security'
                 })
 
+            _save_session(session_id, session)
             return jsonify({
                 'success': True,
                 'message': 'I can only assist with safe travel planning. Please ask about hotels, attractions, itineraries, or travel advice.',
@@ -1131,84 +1756,96 @@ def chat():
             if session['off_topic_warnings'] == 1:
                 response_msg = f"I\'m a travel planning assistant and can only help with travel-related queries. {validation_result.get('suggestion', 'Try asking about travel planning!')}"
             elif session['off_topic_warnings'] == 2:
-                response_msg = f"I\'m specifically designed for travel planning only. Please ask about destinations, hotels, attractions, itineraries, or travel budgets."
+                response_msg = OFF_TOPIC_SECOND_WARNING
             elif session['off_topic_warnings'] >= 3:
-                response_msg = "I can ONLY assist with travel planning. I cannot help with other topics. Please ask about: hotels, attractions, itineraries, travel budgets, or destination recommendations."
+                response_msg = OFF_TOPIC_FINAL_WARNING
             else:
                 response_msg = f"I\'m here exclusively for travel assistance. {validation_result.get('suggestion', '')}"
 
+            _save_session(session_id, session)
             return jsonify({
                 'success': True,
                 'message': response_msg,
                 'off_topic': True,
                 'category': validation_result.get('category'),
                 'warnings': session['off_topic_warnings'],
-                'travel_examples': [
-                    "Find luxury hotels in Paris under $400",
-                    "Create a 5-day Tokyo itinerary",
-                    "What\'s the budget for a Barcelona trip?",
-                    "Best attractions in London",
-                    "Weather in Dubai in December"
-                ]
+                'travel_examples': TRAVEL_EXAMPLES
             })
 
-        # Build travel-focused conversation context
-        messages = [
-            {
-                "role": "system",
-                "content": """You are an expert travel planning assistant. You specialize EXCLUSIVELY in helping travelers plan amazing trips.
+        # Trim before the cache key is computed so the digest covers exactly
+        # the history the OpenAI call would see
+        _trim_history_to_budget(session)
+
+        # Serve repeated questions from the response cache. Cached turns are
+        # answers in context: the key mixes the canonicalized message with a
+        # digest of the trimmed history, so "plan that trip for 5 days" in a
+        # Tokyo conversation never serves a Paris conversation
+        key_hash = hashlib.blake2b(user_message.lower().encode(), digest_size=16)
+        for message in session['messages']:
+            key_hash.update(orjson.dumps(message))
+        cache_key = key_hash.hexdigest()
+        with _response_cache_lock:
+            cached_turn = _response_cache.get(cache_key)
+        if cached_turn:
+            final_message, function_name, function_args, function_result = cached_turn
 
-Your capabilities include:
-1. Hotel and accommodation searches with detailed filtering
-2. Tourist attraction discovery and recommendations
-3. Comprehensive travel itinerary creation
-4. Accurate travel budget estimation
-5. Weather-based travel timing advice
-
-IMPORTANT GUIDELINES:
-- You ONLY help with travel-related queries
-- Use the available travel functions whenever appropriate
-- Provide detailed, helpful, and enthusiastic travel advice
-- Always prioritize user safety and practical travel recommendations
-- Include specific details like prices, ratings, and practical tips
-- Be conversational and engaging while remaining professional
-
-Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona, Rome, Bangkok, Sydney, and Mumbai with comprehensive data for each location."""
+            session['messages'].extend([
+                {"role": "user", "content": user_message},
+                {"role": "assistant", "content": final_message}
+            ])
+            _save_session(session_id, session)
+
+            # Streaming clients must get SSE regardless of cache state, so a
+            # hit is replayed as one delta frame plus the terminal frame
+            done_payload = {
+                'message': final_message,
+                'function_called': function_name,
+                'function_result': function_result,
+                'function_args': function_args,
+                'session_id': session_id,
+                'travel_query': True,
+                'cached': True
             }
-        ]
+            if data.get('stream'):
+                def replay_cached():
+                    yield _sse({'delta': final_message})
+                    yield _sse({**done_payload, 'done': True})
+                return Response(stream_with_context(replay_cached()), mimetype='text/event-stream')
+
+            return jsonify({**done_payload, 'success': True})
 
-        # Add recent conversation history (last 10 messages)
-        messages.extend(session['messages'][-10:])
+        # Build the conversation in one splat: shared system prompt, the
+        # history deque (capped at the 10-message window and trimmed to the
+        # token budget above) and the current user turn - no prefix rebuilds
+        messages = [_SYSTEM_MSG, *session['messages'], {"role": "user", "content": user_message}]
 
-        # Add current user message
-        messages.append({"role": "user", "content": user_message})
+        # Opt-in SSE streaming; the default JSON shape stays unchanged for
+        # clients that do not request it
+        if data.get('stream'):
+            return _stream_chat(messages, session, session_id, user_message, cache_key)
 
-        # Call OpenAI with functions
-        response = call_openai_with_functions(messages, session_id)
+        # First OpenAI call, streamed so the travel function can run
+        # speculatively while the stream tail drains
+        first_turn = _collect_first_call(messages, session_id)
 
-        if not response:
+        if first_turn is None:
             return jsonify({
                 'error': 'Travel planning service temporarily unavailable. Please try again.',
                 'retry': True
             }), 500
 
-        # Process the response
-        response_message = response.choices[0].message
+        regular_response, function_name, function_args, function_future = first_turn
 
         # Check if AI wants to call a function
-        if response_message.get("function_call"):
-            function_name = response_message["function_call"]["name"]
-
-            try:
-                function_args = json.loads(response_message["function_call"]["arguments"])
-            except json.JSONDecodeError:
+        if function_name:
+            if function_future is None and function_name in function_mapping:
                 return jsonify({'error': 'Invalid function call from AI'}), 500
 
             logger.info(f"Travel function called: {function_name} with args: {function_args}")
 
-            # Execute the travel function
+            # Collect the (already running) travel function result
             if function_name in function_mapping:
-                function_result = function_mapping[function_name](**function_args)
+                function_result = function_future.result()
 
                 # Add function call and result to conversation
                 function_call_message = {
@@ -1216,14 +1853,14 @@ Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona,
                     "content": None,
                     "function_call": {
                         "name": function_name,
-                        "arguments": json.dumps(function_args)
+                        "arguments": orjson.dumps(function_args).decode()
                     }
                 }
 
                 function_result_message = {
                     "role": "function",
                     "name": function_name,
-                    "content": json.dumps(function_result)
+                    "content": orjson.dumps(function_result).decode()
                 }
 
                 messages.append(function_call_message)
@@ -1235,6 +1872,10 @@ Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona,
                 if final_response:
                     final_message = final_response.choices[0].message.content
 
+                    with _response_cache_lock:
+                        _response_cache[cache_key] = (final_message, function_name,
+                                                      function_args, function_result)
+
                     # Update session with travel conversation
                     session['messages'].extend([
                         {"role": "user", "content": user_message},
@@ -1242,6 +1883,7 @@ Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona,
                         function_result_message,
                         {"role": "assistant", "content": final_message}
                     ])
+                    _save_session(session_id, session)
 
                     return jsonify({
                         'success': True,
@@ -1260,6 +1902,7 @@ Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona,
                         {"role": "user", "content": user_message},
                         {"role": "assistant", "content": fallback_msg}
                     ])
+                    _save_session(session_id, session)
 
                     return jsonify({
                         'success': True,
@@ -1274,13 +1917,13 @@ Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona,
                 return jsonify({'error': f'Unknown travel function: {function_name}'}), 400
         else:
             # Regular response without function calling
-            regular_response = response_message.content
 
             # Update session
             session['messages'].extend([
                 {"role": "user", "content": user_message},
                 {"role": "assistant", "content": regular_response}
             ])
+            _save_session(session_id, session)
 
             return jsonify({
                 'success': True,
@@ -1301,12 +1944,11 @@ Available destinations include Paris, London, Tokyo, New York, Dubai, Barcelona,
 def reset_chat():
     """Reset chat session"""
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data() or b'{}')
         session_id = data.get('session_id', 'default')
 
         # Clear session data
-        if session_id in conversation_sessions:
-            del conversation_sessions[session_id]
+        _delete_session(session_id)
 
         logger.info(f"Travel chat session {session_id} reset")
 
@@ -1324,49 +1966,13 @@ def reset_chat():
 @app.route('/api/travel-destinations', methods=['GET'])
 def get_travel_destinations():
     """Get available travel destinations"""
-    try:
-        destinations = []
-        if not hotels_df.empty:
-            cities = hotels_df['city'].unique()
-            countries = hotels_df.groupby('city')['country'].first().to_dict()
-
-            for city in sorted(cities):
-                hotel_count = len(hotels_df[hotels_df['city'] == city])
-                attraction_count = len(
-                    attractions_df[attractions_df['city'] == city]) if not attractions_df.empty else 0
-
-                destinations.append({
-                    'city': city,
-                    'country': countries[city],
-                    'hotels_available': hotel_count,
-                    'attractions_available': attraction_count
-                })
-
-        return jsonify({
-            'success': True,
-            'destinations': destinations,
-            'total_cities': len(destinations)
-        })
-
-    except Exception as e:
-        logger.error(f"Error getting destinations: {e}")
-        return jsonify({'error': 'Failed to load destinations'}), 500
+    return Response(_DESTINATIONS_RESPONSE_BYTES, mimetype='application/json')
 
 
 @app.route('/api/functions', methods=['GET'])
 def get_available_functions():
     """Get available travel functions"""
-    return jsonify({
-        'functions': [
-            {
-                'name': func['name'],
-                'description': func['description'],
-                'parameters': func['parameters']
-            }
-            for func in travel_functions
-        ],
-        'scope': 'travel_planning_only'
-    })
+    return Response(_FUNCTIONS_RESPONSE_BYTES, mimetype='application/json')
 
 
 @app.route('/api/session-status', methods=['GET'])
@@ -1375,15 +1981,16 @@ def session_status():
     try:
         session_id = request.args.get('session_id', 'default')
 
-        if session_id in conversation_sessions:
-            session = conversation_sessions[session_id]
+        session = _load_session(session_id)
+
+        if session is not None:
             return jsonify({
                 'success': True,
                 'session_active': True,
                 'message_count': session['message_count'],
                 'off_topic_warnings': session['off_topic_warnings'],
                 'security_violations': session['security_violations'],
-                'created_at': session['created_at'].isoformat()
+                'created_at': datetime.fromtimestamp(session['created_at'], tz=timezone.utc).isoformat()
             })
         else:
             return jsonify({
@@ -1397,7 +2004,5 @@ def session_status():
 
 
 if __name__ == '__main__':
-    # Clean up old sessions on startup
-    conversation_sessions.clear()
     logger.info(" Travel Planner AI Chatbot starting - Advanced implementation with security and function calling")
     app.run(debug=True, port=5000, host='0.0.0.0')